@@ -1,19 +1,20 @@
 from fastapi import APIRouter, Request
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import FileResponse
-from pathlib import Path
+from core.templating import cached_page, prerender
 
-templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
 education_router = APIRouter()
 
+_COLLEGE = prerender("pages/education/college.html")
+_EARLY_EDUCATION = prerender("pages/education/early_education.html")
+_AGILE_REPORT = prerender("pages/education/agile_report.html")
+
 @education_router.get("/education/college")
 async def test(request: Request):
-    return templates.TemplateResponse("pages/education/college.html", {"request": request})
+    return cached_page(request, _COLLEGE)
 
 @education_router.get("/education/early_education")
 async def test(request: Request):
-    return templates.TemplateResponse("pages/education/early_education.html", {"request": request})
+    return cached_page(request, _EARLY_EDUCATION)
 
 @education_router.get("/education/agile_report")
 async def agile_report(request: Request):
-    return templates.TemplateResponse("pages/education/agile_report.html", {"request": request})
\ No newline at end of file
+    return cached_page(request, _AGILE_REPORT)
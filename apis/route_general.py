@@ -1,15 +1,31 @@
 from fastapi import APIRouter, Request
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import FileResponse
+from fastapi.responses import Response
 from pathlib import Path
+from core.templating import templates
+import hashlib
 
-templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
 general_router = APIRouter()
 
+_FAVICON = (Path(__file__).parent.parent / "favicon.ico").read_bytes()
+_FAVICON_HEADERS = {
+    "Cache-Control": "public, max-age=604800",
+    "ETag": f'"{hashlib.blake2b(_FAVICON, digest_size=8).hexdigest()}"',
+}
+
 @general_router.get("/")
 async def test(request: Request):
     return templates.TemplateResponse("pages/home.html", {"request": request})
 
 @general_router.get('/favicon.ico', include_in_schema=False)
-async def favicon():
-    return FileResponse('favicon.ico')
\ No newline at end of file
+async def favicon(request: Request):
+    if request.headers.get("if-none-match") == _FAVICON_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_FAVICON_HEADERS)
+    return Response(content=_FAVICON, media_type="image/x-icon", headers=_FAVICON_HEADERS)
+
+# Compile templates at import so the first request after a cold start doesn't pay for it
+for _name in (
+    "shared/base.html",
+    "components/navbar.html",
+    "pages/home.html",
+):
+    templates.env.get_template(_name)
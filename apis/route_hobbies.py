@@ -1,23 +1,11 @@
-from fastapi import APIRouter, Request
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import FileResponse
-from pathlib import Path
+from fastapi import APIRouter
+from core.templating import add_page_routes
 
-templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
 hobby_router = APIRouter()
 
-@hobby_router.get("/hobbies/tennis")
-async def test(request: Request):
-    return templates.TemplateResponse("pages/hobbies/tennis.html", {"request": request})
-
-@hobby_router.get("/hobbies/gaming")
-async def test(request: Request):
-    return templates.TemplateResponse("pages/hobbies/gaming.html", {"request": request})
-
-@hobby_router.get("/hobbies/3d_printing/puzzles")
-async def test(request: Request):
-    return templates.TemplateResponse("pages/hobbies/3d_printing/puzzles.html", {"request": request})
-
-@hobby_router.get("/hobbies/3d_printing/other_models")
-async def test(request: Request):
-    return templates.TemplateResponse("pages/hobbies/3d_printing/other_models.html", {"request": request})
\ No newline at end of file
+add_page_routes(hobby_router, (
+    ("/hobbies/tennis", "pages/hobbies/tennis.html"),
+    ("/hobbies/gaming", "pages/hobbies/gaming.html"),
+    ("/hobbies/3d_printing/puzzles", "pages/hobbies/3d_printing/puzzles.html"),
+    ("/hobbies/3d_printing/other_models", "pages/hobbies/3d_printing/other_models.html"),
+))
@@ -1,11 +1,8 @@
-from fastapi import APIRouter, Request
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import FileResponse
-from pathlib import Path
+from fastapi import APIRouter
+from core.templating import add_page_routes
 
-templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
 other_router = APIRouter()
 
-@other_router.get("/jobs")
-async def test(request: Request):
-    return templates.TemplateResponse("pages/jobs.html", {"request": request})
\ No newline at end of file
+add_page_routes(other_router, (
+    ("/jobs", "pages/jobs.html"),
+))
@@ -0,0 +1,33 @@
+from fastapi import Request
+from fastapi.responses import Response
+from fastapi.templating import Jinja2Templates
+from pathlib import Path
+import hashlib
+
+templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
+
+
+# Pages that don't depend on the request are rendered once at import and served
+# as the same bytes (with an ETag so browsers can revalidate with a 304)
+def prerender(name):
+    body = templates.get_template(name).render().encode()
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    return body, etag
+
+
+def cached_page(request, page):
+    body, etag = page
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="text/html", headers={"ETag": etag})
+
+
+def add_page_routes(router, pages):
+    for path, name in pages:
+        _add_page_route(router, path, prerender(name))
+
+
+def _add_page_route(router, path, page):
+    @router.get(path)
+    async def page_route(request: Request):
+        return cached_page(request, page)
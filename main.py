@@ -1,4 +1,4 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from core.config import settings
 from fastapi.staticfiles import StaticFiles
 from apis.route_general import general_router
@@ -15,6 +15,28 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class RequestLoggingMiddleware:
+    # Plain ASGI rather than @app.middleware("http"), which wraps every request
+    # in BaseHTTPMiddleware's extra task and memory stream
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        logger.info("INCOMING REQUEST: %s %s", scope["method"], path)
+
+        async def send_with_logging(message):
+            if message["type"] == "http.response.start":
+                logger.info("RESPONSE STATUS: %s for %s", message["status"], path)
+            await send(message)
+
+        await self.app(scope, receive, send_with_logging)
+
+
 def include_router(app):
     app.include_router(general_router)
     app.include_router(education_router)
@@ -32,14 +54,7 @@ def start_application():
     app = FastAPI(title=settings.PROJECT_NAME, version=settings.PROJECT_VERSION)
     include_router(app)
     configure_static(app)
-
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next):
-        logger.info(f"INCOMING REQUEST: {request.method} {request.url.path}")
-        response = await call_next(request)
-        logger.info(f"RESPONSE STATUS: {response.status_code} for {request.url.path}")
-        return response
-
+    app.add_middleware(RequestLoggingMiddleware)
     return app
 
 